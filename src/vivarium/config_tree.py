@@ -29,6 +29,8 @@ For example:
     'value6'
 
 """
+import copy
+import functools
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
@@ -36,6 +38,12 @@ import yaml
 
 from vivarium.exceptions import VivariumError
 
+try:
+    # The libyaml bindings parse several times faster than the pure python loader.
+    from yaml import CFullLoader as _YamlLoader
+except ImportError:
+    from yaml import FullLoader as _YamlLoader
+
 
 class ConfigurationError(VivariumError):
     """Base class for configuration errors."""
@@ -102,6 +110,8 @@ class ConfigNode:
 
     """
 
+    __slots__ = ("_name", "_layers", "_values", "_frozen", "_accessed")
+
     def __init__(self, layers: List[str], name: str):
         self._name = name
         self._layers = layers
@@ -301,6 +311,8 @@ class ConfigTree:
         """
         self.__dict__["_layers"] = layers if layers else ["base"]
         self.__dict__["_children"] = {}
+        # Outermost values of leaf children, filled on first lookup.
+        self.__dict__["_resolved"] = {}
         self.__dict__["_frozen"] = False
         self.__dict__["_name"] = name
         self.update(data, layer=self._layers[0], source="initial data")
@@ -368,13 +380,19 @@ class ConfigTree:
             The name of the layer to retrieve the value from.
 
         """
-        if name not in self:
+        if layer is None and name in self._resolved:
+            return self._resolved[name]
+
+        if name not in self._children:
             name = f"{self._name}.{name}" if self._name else name
             raise ConfigurationKeyError(f"No value at name {name}.", name)
 
         child = self._children[name]
         if isinstance(child, ConfigNode):
-            return child.get_value(layer)
+            value = child.get_value(layer)
+            if layer is None:
+                self._resolved[name] = value
+            return value
         else:
             return child
 
@@ -427,7 +445,7 @@ class ConfigTree:
                 self._set_with_metadata(k, v, layer, source)
 
     def metadata(self, name: str) -> List[Dict[str, Any]]:
-        if name in self:
+        if name in self._children:
             return self._children[name].metadata
         name = f"{self._name}.{name}" if self._name else name
         raise ConfigurationKeyError(f"No configuration value with name {name}", name)
@@ -443,12 +461,10 @@ class ConfigTree:
             data, Path
         ):
             source = source if source else str(data)
-            with open(data) as f:
-                data = f.read()
-            data = yaml.full_load(data)
+            data = _read_yaml_file(data)
             return data, source
         elif isinstance(data, str):
-            data = yaml.full_load(data)
+            data = yaml.load(data, Loader=_YamlLoader)
             return data, source
         elif isinstance(data, ConfigTree):
             return data.to_dict(), source
@@ -495,7 +511,7 @@ class ConfigTree:
             )
 
         if isinstance(value, dict):
-            if name not in self:
+            if name not in self._children:
                 self._children[name] = ConfigTree(layers=list(self._layers), name=name)
             if isinstance(self._children[name], ConfigNode):
                 name = f"{self._name}.{name}" if self._name else name
@@ -503,17 +519,18 @@ class ConfigTree:
                     f"Can't assign a dictionary as a value to a ConfigNode.", name
                 )
         else:
-            if name not in self:
+            if name not in self._children:
                 self._children[name] = ConfigNode(list(self._layers), name=self._name)
             if isinstance(self._children[name], ConfigTree):
                 name = f"{self._name}.{name}" if self._name else name
                 raise ConfigurationError(f"Can't assign a value to a ConfigTree.", name)
 
+        self._resolved.pop(name, None)
         self._children[name].update(value, layer, source)
 
     def __setattr__(self, name, value):
         """Set a value on the outermost layer."""
-        if name not in self:
+        if name not in self._children:
             raise ConfigurationKeyError(
                 "New configuration keys can only be created with the update method.",
                 self._name,
@@ -522,7 +539,7 @@ class ConfigTree:
 
     def __setitem__(self, name, value):
         """Set a value on the outermost layer."""
-        if name not in self:
+        if name not in self._children:
             raise ConfigurationKeyError(
                 "New configuration keys can only be created with the update method.",
                 self._name,
@@ -538,12 +555,14 @@ class ConfigTree:
         return self.get_from_layer(name)
 
     def __delattr__(self, name):
-        if name in self:
+        if name in self._children:
             del self._children[name]
+            self._resolved.pop(name, None)
 
     def __delitem__(self, name):
-        if name in self:
+        if name in self._children:
             del self._children[name]
+            self._resolved.pop(name, None)
 
     def __contains__(self, name):
         """Test if a configuration key exists in any layer."""
@@ -574,3 +593,17 @@ class ConfigTree:
                 for name, c in self._children.items()
             ]
         )
+
+
+def _read_yaml_file(path: Union[str, Path]) -> Any:
+    """Parses a yaml file, reusing the previous parse if the file is unchanged."""
+    path = Path(path).resolve()
+    stat = path.stat()
+    return copy.deepcopy(_parse_yaml_file(str(path), stat.st_mtime_ns, stat.st_size))
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_yaml_file(path: str, modified_time: int, size: int) -> Any:
+    # The modification time and size are only part of the cache key.
+    with open(path) as f:
+        return yaml.load(f, Loader=_YamlLoader)
@@ -26,11 +26,13 @@ class Observer:
     def metrics(self, index: pd.Index, metrics: Dict):
 
         pop = self.population_view.get(index)
-        metrics["total_population_alive"] = len(pop[pop.alive == "alive"])
-        metrics["total_population_dead"] = len(pop[pop.alive == "dead"])
+        is_dead = pop["alive"].to_numpy() == "dead"
+        n_dead = int(is_dead.sum())
+        metrics["total_population_alive"] = len(pop) - n_dead
+        metrics["total_population_dead"] = n_dead
 
         metrics["years_of_life_lost"] = (
-            self.life_expectancy - pop.age[pop.alive == "dead"]
+            self.life_expectancy - pop["age"].to_numpy()[is_dead]
         ).sum()
 
         return metrics
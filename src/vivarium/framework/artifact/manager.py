@@ -18,6 +18,7 @@ from vivarium.config_tree import ConfigTree
 from vivarium.framework.artifact.artifact import Artifact
 
 _Filter = Union[str, int, Sequence[int], Sequence[str]]
+_COMPARISON_OPERATOR = re.compile("[<=>]")
 
 
 class ArtifactManager:
@@ -157,7 +158,7 @@ def filter_data(
 
 def _config_filter(data, config_filter_term):
     if config_filter_term:
-        filter_column = re.split("[<=>]", config_filter_term.split()[0])[0]
+        filter_column = _COMPARISON_OPERATOR.split(config_filter_term.split()[0])[0]
         if filter_column in data.columns:
             data = data.query(config_filter_term)
     return data
@@ -15,6 +15,7 @@ and managers and components are given to it by the context. It is called on to
 setup everything it holds when the context itself is setup.
 
 """
+import functools
 import inspect
 import typing
 from typing import Any, Dict, Iterator, List, Tuple, Type, Union
@@ -42,6 +43,7 @@ class OrderedComponentSet:
 
     def __init__(self, *args):
         self.components = []
+        self._names = set()
         if args:
             self.update(args)
 
@@ -51,6 +53,7 @@ class OrderedComponentSet:
                 f"Attempting to add a component with duplicate name: {component}"
             )
         self.components.append(component)
+        self._names.add(component.name)
 
     def update(self, components: Union[List[Any], Tuple[Any]]):
         for c in components:
@@ -58,12 +61,13 @@ class OrderedComponentSet:
 
     def pop(self) -> Any:
         component = self.components.pop(0)
+        self._names.discard(component.name)
         return component
 
     def __contains__(self, component: Any) -> bool:
         if not hasattr(component, "name"):
             raise ComponentConfigError(f"Component {component} has no name attribute")
-        return component.name in [c.name for c in self.components]
+        return component.name in self._names
 
     def __iter__(self) -> Iterator:
         return iter(self.components)
@@ -112,6 +116,8 @@ class ComponentManager:
     def __init__(self):
         self._managers = OrderedComponentSet()
         self._components = OrderedComponentSet()
+        # Results of get_components_by_type, keyed by the requested type(s).
+        self._components_by_type = {}
         self.configuration = None
         self.lifecycle = None
 
@@ -162,6 +168,7 @@ class ComponentManager:
             Instantiated components to register.
 
         """
+        self._components_by_type.clear()
         for c in self._flatten(components):
             self.apply_configuration_defaults(c)
             self._components.add(c)
@@ -182,7 +189,11 @@ class ComponentManager:
             A list of components of type ``component_type``.
 
         """
-        return [c for c in self._components if isinstance(c, component_type)]
+        if component_type not in self._components_by_type:
+            self._components_by_type[component_type] = [
+                c for c in self._components if isinstance(c, component_type)
+            ]
+        return list(self._components_by_type[component_type])
 
     def get_component(self, name: str) -> Any:
         """Get the component with name ``name``.
@@ -273,7 +284,7 @@ class ComponentManager:
             # file to attribute it to.
             return "__main__"
         else:
-            return inspect.getfile(component.__class__)
+            return _get_class_file(component.__class__)
 
     @staticmethod
     def _flatten(components: List):
@@ -299,6 +310,12 @@ class ComponentManager:
         return "ComponentManager()"
 
 
+@functools.lru_cache(maxsize=None)
+def _get_class_file(component_class: type) -> str:
+    # inspect.getfile searches sys.modules, so remember the answer per class.
+    return inspect.getfile(component_class)
+
+
 class ComponentInterface:
     """The builder interface for the component manager system. This class
     defines component manager methods a ``vivarium`` component can access from
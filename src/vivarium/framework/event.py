@@ -91,6 +91,31 @@ class EventChannel:
         self.name = f"event_channel_{name}"
         self.manager = manager
         self.listeners = [[] for _ in range(10)]
+        self._ordered_listeners = None
+
+    @property
+    def ordered_listeners(self) -> List[Callable]:
+        """All listeners to this channel in the order they are notified."""
+        if self._ordered_listeners is None:
+            self._ordered_listeners = [
+                listener for bucket in self.listeners for listener in bucket
+            ]
+        return self._ordered_listeners
+
+    def add_listener(self, listener: Callable, priority: int):
+        """Adds a listener to this channel at the given priority level.
+
+        Parameters
+        ----------
+        listener
+            The consumer of events emitted on this channel.
+        priority
+            Number in range(10) used to assign the ordering in which listeners
+            process the event.
+
+        """
+        self.listeners[priority].append(listener)
+        self._ordered_listeners = None
 
     def emit(self, index: pd.Index, user_data: Dict = None) -> Event:
         """Notifies all listeners to this channel that an event has occurred.
@@ -110,20 +135,15 @@ class EventChannel:
         """
         if not user_data:
             user_data = {}
-        e = Event(
-            index,
-            user_data,
-            self.manager.clock() + self.manager.step_size(),
-            self.manager.step_size(),
-        )
+        step_size = self.manager.step_size()
+        e = Event(index, user_data, self.manager.clock() + step_size, step_size)
 
-        for priority_bucket in self.listeners:
-            for listener in priority_bucket:
-                listener(e)
+        for listener in self.ordered_listeners:
+            listener(e)
         return e
 
     def __repr__(self):
-        return f"EventChannel(listeners: {[listener for bucket in self.listeners for listener in bucket]})"
+        return f"EventChannel(listeners: {self.ordered_listeners})"
 
 
 class EventManager:
@@ -173,7 +193,7 @@ class EventManager:
 
     def on_post_setup(self, event):
         for name, channel in self._event_types.items():
-            self.add_handlers(name, [h for level in channel.listeners for h in level])
+            self.add_handlers(name, channel.ordered_listeners)
 
     def get_emitter(self, name: str) -> Callable[[pd.Index, Optional[Dict]], Event]:
         """Get an emitter function for the named event.
@@ -212,7 +232,7 @@ class EventManager:
             Number in range(10) used to assign the ordering in which listeners
             process the event.
         """
-        self.get_channel(name).listeners[priority].append(listener)
+        self.get_channel(name).add_listener(listener, priority)
 
     def get_listeners(self, name: str) -> Dict[int, List[Callable]]:
         """Get  all listeners registered for the named event.
@@ -1,6 +1,5 @@
 import warnings
-from collections import defaultdict
-from typing import Callable, Dict, List, Tuple
+from typing import Callable, Dict, List, NamedTuple, Set, Tuple
 
 import pandas as pd
 from loguru import logger
@@ -9,6 +8,16 @@ from vivarium.framework.results.exceptions import ResultsConfigurationError
 from vivarium.framework.results.stratification import Stratification
 
 
+class Observation(NamedTuple):
+    """A registered observation and the pieces needed to produce its results."""
+
+    name: str
+    aggregator_sources: List[str]
+    aggregator: Callable[[pd.DataFrame], float]
+    # Formatted additional keys shared by every result of the observation.
+    key_suffix: str
+
+
 class ResultsContext:
     """
     Manager context for organizing observations and the stratifications they require.
@@ -21,9 +30,18 @@ class ResultsContext:
     def __init__(self):
         self._default_stratifications: List[str] = []
         self._stratifications: List[Stratification] = []
-        # keys are event names: ["time_step__prepare", "time_step", "time_step__cleanup", "collect_metrics"]
-        # values are dicts with key (filter, grouper) value (measure, aggregator_sources, aggregator, additional_keys)
-        self._observations = defaultdict(lambda: defaultdict(list))
+        self._stratification_names: Set[str] = set()
+        # keys are (event_name, filter, grouper) with event names in
+        # ["time_step__prepare", "time_step", "time_step__cleanup", "collect_metrics"]
+        # values are lists of Observations
+        self._observations: Dict[Tuple[str, str, Tuple[str, ...]], List[Observation]] = {}
+        # keys are event names, values are the _observations keys for that event
+        self._observation_keys: Dict[str, List[Tuple[str, str, Tuple[str, ...]]]] = {}
+        # keys are (additional, excluded) stratification tuples, values are the
+        # resolved groupers, so equal requests share one tuple object
+        self._stratifications_cache: Dict[
+            Tuple[Tuple[str, ...], Tuple[str, ...]], Tuple[str, ...]
+        ] = {}
 
     # noinspection PyAttributeOutsideInit
     def set_default_stratifications(self, default_grouping_columns: List[str]):
@@ -37,7 +55,9 @@ class ResultsContext:
                 "Attempting to set an empty list as the default grouping columns "
                 "for results production."
             )
-        self._default_grouping_columns = default_grouping_columns
+        # Defaults are fixed once set, so they are stored immutably.
+        self._default_stratifications = tuple(default_grouping_columns)
+        self._stratifications_cache.clear()
 
     def add_stratification(
         self,
@@ -70,10 +90,11 @@ class ResultsContext:
         ------
         None
         """
-        if len([s.name for s in self._stratifications if s.name == name]):
+        if name in self._stratification_names:
             raise ValueError(f"Name `{name}` is already used")
         stratification = Stratification(name, sources, categories, mapper, is_vectorized)
         self._stratifications.append(stratification)
+        self._stratification_names.add(name)
 
     def add_observation(
         self,
@@ -90,25 +111,44 @@ class ResultsContext:
         stratifications = self._get_stratifications(
             additional_stratifications, excluded_stratifications
         )
-        self._observations[when][(pop_filter, stratifications)].append(
-            (name, aggregator_sources, aggregator, additional_keys)
+        key = (when, pop_filter, stratifications)
+        if key not in self._observations:
+            self._observations[key] = []
+            self._observation_keys.setdefault(when, []).append(key)
+        self._observations[key].append(
+            Observation(
+                name,
+                aggregator_sources,
+                aggregator,
+                self._format_key_suffix(**additional_keys),
+            )
         )
 
+    def has_observations(self, event_name: str) -> bool:
+        """Whether any observations are registered for the named event."""
+        return event_name in self._observation_keys
+
     def gather_results(self, population: pd.DataFrame, event_name: str) -> Dict[str, float]:
         # Optimization: We store all the producers by pop_filter and stratifications
         # so that we only have to apply them once each time we compute results.
         for stratification in self._stratifications:
             population = stratification(population)
 
-        for (pop_filter, stratifications), observations in self._observations[
-            event_name
-        ].items():
+        # Observations with different stratifications often share a filter, so
+        # each filter is only evaluated once per event.
+        filtered_populations = {}
+        for key in self._observation_keys.get(event_name, []):
+            _, pop_filter, stratifications = key
+            observations = self._observations[key]
             # Results production can be simplified to
             # filter -> groupby -> aggregate in all situations we've seen.
-            if pop_filter:
-                population = population.query(pop_filter)
-            pop_groups = population.groupby(list(stratifications))
-            for measure, aggregator_sources, aggregator, additional_keys in observations:
+            if pop_filter not in filtered_populations:
+                filtered_populations[pop_filter] = (
+                    population.query(pop_filter) if pop_filter else population
+                )
+            filtered_population = filtered_populations[pop_filter]
+            pop_groups = filtered_population.groupby(list(stratifications))
+            for measure, aggregator_sources, aggregator, key_suffix in observations:
                 if aggregator_sources:
                     aggregates = pop_groups[aggregator_sources].apply(aggregator).fillna(0.0)
                 else:
@@ -124,27 +164,38 @@ class ResultsContext:
                     )
 
                 # Keep formatting all in one place.
-                yield self._format_results(measure, aggregates, **additional_keys)
+                yield self._format_results(measure, aggregates, key_suffix)
 
     def _get_stratifications(
         self,
         additional_stratifications: List[str] = (),
         excluded_stratifications: List[str] = (),
     ) -> Tuple[str, ...]:
-        stratifications = list(
-            set(self._default_stratifications) - set(excluded_stratifications)
-            | set(additional_stratifications)
+        cache_key = (tuple(additional_stratifications), tuple(excluded_stratifications))
+        if cache_key not in self._stratifications_cache:
+            stratifications = list(
+                set(self._default_stratifications) - set(excluded_stratifications)
+                | set(additional_stratifications)
+            )
+            # Makes sure measure identifiers have fields in the same relative order.
+            self._stratifications_cache[cache_key] = tuple(sorted(stratifications))
+        return self._stratifications_cache[cache_key]
+
+    @staticmethod
+    def _format_key_suffix(**additional_keys: str) -> str:
+        """Format the additional keys shared by all of an observation's results."""
+        # Sorts additional_keys by the field name.
+        return "".join(
+            f"_{str(field).upper()}_{category}"
+            for field, category in sorted(additional_keys.items())
         )
-        # Makes sure measure identifiers have fields in the same relative order.
-        return tuple(sorted(stratifications))
 
     @staticmethod
     def _format_results(
         measure: str,
         aggregates: pd.Series,
-        **additional_keys: str,
+        key_suffix: str = "",
     ) -> Dict[str, float]:
-        results = {}
         # First we expand the categorical index over unobserved pairs.
         # This ensures that the produced results are always the same length.
         if isinstance(aggregates.index, pd.MultiIndex):
@@ -156,27 +207,22 @@ class ResultsContext:
         data = pd.Series(data=0, index=idx)
         data.loc[aggregates.index] = aggregates
 
-        def _format(field, param):
-            """Format of the measure identifier tokens into FIELD_param."""
-            return f"{str(field).upper()}_{param}"
-
-        for categories, val in data.items():
-            if isinstance(categories, str):  # handle single stratification case
-                categories = [categories]
-            key = "_".join(
-                [_format("measure", measure)]
-                + [
-                    _format(field, category)
-                    for field, category in zip(data.index.names, categories)
-                ]
-                # Sorts additional_keys by the field name.
-                + [
-                    _format(field, category)
-                    for field, category in sorted(additional_keys.items())
-                ]
-            )
-            results[key] = val
-        return results
+        # Measure identifier tokens are formatted as FIELD_param. The measure,
+        # field names and additional keys are shared by every row, so they are
+        # formatted once and only the categories are filled in per row.
+        prefix = f"MEASURE_{measure}"
+        fields = [f"_{str(field).upper()}_" for field in data.index.names]
+        if isinstance(data.index, pd.MultiIndex):
+            rows = data.index
+        else:  # handle single stratification case
+            rows = ((category,) for category in data.index)
+        keys = [
+            prefix
+            + "".join(f"{field}{category}" for field, category in zip(fields, categories))
+            + key_suffix
+            for categories in rows
+        ]
+        return dict(zip(keys, data.tolist()))
 
     def _warn_check_stratifications(
         self, additional_stratifications, excluded_stratifications
@@ -33,7 +33,10 @@ class ResultsManager:
         self._metrics = Counter()
         self._results_context = ResultsContext()
         self._required_columns = {"tracked"}
-        self._required_values = set()
+        # Required pipelines keyed by name, in registration order.
+        self._required_values = {}
+        # View over the required columns, built on first use.
+        self._results_view = None
         self._name = "results_manager"
 
     @property
@@ -73,6 +76,9 @@ class ResultsManager:
         self.gather_results("collect_metrics", event)
 
     def gather_results(self, event_name: str, event: Event):
+        if not self._results_context.has_observations(event_name):
+            # Nothing to observe, so don't pay for building the population.
+            return
         population = self._prepare_population(event)
         for results_group in self._results_context.gather_results(population, event_name):
             self._metrics.update(results_group)
@@ -197,20 +203,24 @@ class ResultsManager:
         target = set(target) - {"event_time", "current_time", "step_size"}
         if target_type == SourceType.COLUMN:
             self._required_columns.update(target)
+            self._results_view = None
         elif target_type == SourceType.VALUE:
-            self._required_values.update(self.get_value(target))
+            for name in sorted(target):
+                if name not in self._required_values:
+                    self._required_values[name] = self.get_value(name)
 
     def _prepare_population(self, event: Event):
-        population = self.population_view.subview(list(self._required_columns)).get(
-            event.index
-        )
-        population["current_time"] = self.clock()
+        if self._results_view is None:
+            self._results_view = self.population_view.subview(list(self._required_columns))
+        population = self._results_view.get(event.index)
+        current_time = self.clock()
+        population["current_time"] = current_time
         population["step_size"] = event.step_size
-        population["event_time"] = self.clock() + event.step_size
+        population["event_time"] = current_time + event.step_size
         for k, v in event.user_data.items():
             population[k] = v
-        for pipeline in self._required_values:
-            population[pipeline.name] = pipeline(event.index)
+        for name, pipeline in self._required_values.items():
+            population[name] = pipeline(event.index)
         return population
 
     def get_results(self, index, metrics):
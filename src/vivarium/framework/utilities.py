@@ -13,21 +13,24 @@ from typing import Any, Callable
 
 import numpy as np
 
+_SECONDS_PER_YEAR = 60 * 60 * 24 * 365.0
+
 
 def from_yearly(value, time_step):
-    return value * (time_step.total_seconds() / (60 * 60 * 24 * 365.0))
+    return value * (time_step.total_seconds() / _SECONDS_PER_YEAR)
 
 
 def to_yearly(value, time_step):
-    return value / (time_step.total_seconds() / (60 * 60 * 24 * 365.0))
+    return value / (time_step.total_seconds() / _SECONDS_PER_YEAR)
 
 
 def rate_to_probability(rate):
     # encountered underflow from rate > 30k
     # for rates greater than 250, exp(-rate) evaluates to 1e-109
     # beware machine-specific floating point issues
-    rate[rate > 250] = 250.0
-    return 1 - np.exp(-rate)
+    rate = np.minimum(rate, 250.0)
+    # expm1 keeps full precision for the small rates typical of a single step.
+    return -np.expm1(-rate)
 
 
 def probability_to_rate(probability):
@@ -12,7 +12,6 @@ See the associated tutorials for :ref:`running <interactive_tutorial>` and
 :ref:`exploring <exploration_tutorial>` for more information.
 
 """
-from math import ceil
 from typing import Any, Callable, Dict, List
 
 import pandas as pd
@@ -51,13 +50,14 @@ class InteractiveContext(SimulationContext):
             An optional size of step to take. Must be the same type as the
             simulation clock's step size (usually a pandas.Timedelta).
         """
+        if step_size is None:
+            super().step()
+            return
+
         old_step_size = self._clock.step_size
-        if step_size is not None:
-            if not isinstance(step_size, type(self._clock.step_size)):
-                raise ValueError(
-                    f"Provided time must be an instance of {type(self._clock.step_size)}"
-                )
-            self._clock._step_size = step_size
+        if not isinstance(step_size, type(old_step_size)):
+            raise ValueError(f"Provided time must be an instance of {type(old_step_size)}")
+        self._clock._step_size = step_size
         super().step()
         self._clock._step_size = old_step_size
 
@@ -120,7 +120,8 @@ class InteractiveContext(SimulationContext):
         if not isinstance(end_time, type(self._clock.time)):
             raise ValueError(f"Provided time must be an instance of {type(self._clock.time)}")
 
-        iterations = int(ceil((end_time - self._clock.time) / self._clock.step_size))
+        # Ceiling division, kept in integer arithmetic for Timedelta step sizes.
+        iterations = int(-(-(end_time - self._clock.time) // self._clock.step_size))
         self.take_steps(number_of_steps=iterations, with_logging=with_logging)
         assert self._clock.time - self._clock.step_size < end_time <= self._clock.time
         return iterations
@@ -145,12 +146,12 @@ class InteractiveContext(SimulationContext):
         if not isinstance(number_of_steps, int):
             raise ValueError("Number of steps must be an integer.")
 
-        if run_from_ipython() and with_logging:
-            for _ in log_progress(range(number_of_steps), name="Step"):
-                self.step(step_size)
-        else:
-            for _ in range(number_of_steps):
-                self.step(step_size)
+        steps = range(number_of_steps)
+        if with_logging and run_from_ipython():
+            steps = log_progress(steps, name="Step")
+        step = self.step
+        for _ in steps:
+            step(step_size)
 
     def get_population(self, untracked: bool = False) -> pd.DataFrame:
         """Get a copy of the population state table.
@@ -19,6 +19,7 @@ from loguru import logger
 from vivarium.exceptions import VivariumError
 
 
+@functools.lru_cache(maxsize=None)
 def run_from_ipython() -> bool:
     """Taken from https://stackoverflow.com/questions/5376837/how-can-i-do-an-if-run-from-ipython-test-in-python"""
     try:
@@ -30,8 +31,13 @@ def run_from_ipython() -> bool:
 
 def log_progress(sequence, every=None, size=None, name="Items"):
     """Taken from https://github.com/alexanderkuk/log-progress"""
-    from IPython.display import display
-    from ipywidgets import HTML, IntProgress, VBox
+    try:
+        from IPython.display import display
+        from ipywidgets import HTML, IntProgress, VBox
+    except ImportError:
+        # Without the interactive extras there is nothing to display progress with.
+        yield from sequence
+        return
 
     is_iterator = False
     if size is None:
@@ -58,16 +64,17 @@ def log_progress(sequence, every=None, size=None, name="Items"):
     display(box)
 
     index = 0
+    # Update on the first record and on every multiple of `every` after it.
+    next_update = 1
     try:
         for index, record in enumerate(sequence, 1):
-            if index == 1 or index % every == 0:
+            if index == next_update:
+                next_update = (index // every + 1) * every
                 if is_iterator:
-                    label.value = "{name}: {index} / ?".format(name=name, index=index)
+                    label.value = f"{name}: {index} / ?"
                 else:
                     progress.value = index
-                    label.value = "{name}: {index} / {size}".format(
-                        name=name, index=index, size=size
-                    )
+                    label.value = f"{name}: {index} / {size}"
             yield record
     except Exception as e:
         progress.bar_style = "danger"
@@ -6,7 +6,8 @@ Vivarium Testing Utilities
 Utility functions and classes to make testing ``vivarium`` components easier.
 
 """
-from pathlib import Path
+import functools
+import os
 
 import numpy as np
 import pandas as pd
@@ -153,24 +154,31 @@ def build_table(value, year_start, year_end, columns=("age", "year", "sex", "val
     if len(value) != len(value_columns):
         raise ValueError("Number of values must match number of value columns")
 
-    rows = []
-    for age in range(0, 140):
-        for year in range(year_start, year_end + 1):
-            for sex in ["Male", "Female"]:
-                r_values = []
-                for v in value:
-                    if v is None:
-                        r_values.append(np.random.random())
-                    elif callable(v):
-                        r_values.append(v(age, sex, year))
-                    else:
-                        r_values.append(v)
-                rows.append([age, age + 1, year, year + 1, sex] + r_values)
-    return pd.DataFrame(
-        rows,
-        columns=["age_start", "age_end", "year_start", "year_end", "sex"]
-        + list(value_columns),
-    )
+    # Rows run over age, then year, then sex.
+    years = np.arange(year_start, year_end + 1)
+    n_rows = 140 * len(years) * 2
+    ages = np.repeat(np.arange(0, 140), len(years) * 2)
+    years = np.tile(np.repeat(years, 2), 140)
+    sexes = pd.Categorical.from_codes(np.tile([0, 1], n_rows // 2), ["Male", "Female"])
+
+    table = {
+        "age_start": ages,
+        "age_end": ages + 1,
+        "year_start": years,
+        "year_end": years + 1,
+        "sex": sexes,
+    }
+    for column, v in zip(value_columns, value):
+        if v is None:
+            table[column] = np.random.random(n_rows)
+        elif callable(v):
+            table[column] = [
+                v(age, sex, year)
+                for age, sex, year in zip(ages.tolist(), sexes.tolist(), years.tolist())
+            ]
+        else:
+            table[column] = [v] * n_rows
+    return pd.DataFrame(table)
 
 
 def make_dummy_column(name, initial_value):
@@ -208,4 +216,9 @@ def reset_mocks(mocks):
 
 
 def metadata(file_path):
-    return {"layer": "override", "source": str(Path(file_path).resolve())}
+    return {"layer": "override", "source": _realpath(str(file_path))}
+
+
+@functools.lru_cache(maxsize=None)
+def _realpath(file_path: str) -> str:
+    return os.path.realpath(file_path)
@@ -492,3 +492,17 @@ def test_repr_display():
     cfg.update({"Key1": "value_ov_1"}, layer="override_1", source="ov1_src")
     cfg.update({"Key1": "value_ov_2"}, layer="override_2", source="ov2_src")
     assert repr(cfg) == textwrap.dedent(expected_repr)
+
+
+def test_retrieval_after_update():
+    cfg = ConfigTree(layers=["inner", "outer"])
+    cfg.update({"test_key": "test_value"}, layer="inner")
+    assert cfg.test_key == "test_value"
+
+    cfg.update({"test_key": "test_value2"}, layer="outer")
+    assert cfg.test_key == "test_value2"
+    assert cfg.get_from_layer("test_key", layer="inner") == "test_value"
+
+    del cfg.test_key
+    with pytest.raises(ConfigurationKeyError):
+        _ = cfg.test_key
@@ -1,3 +1,5 @@
+import os
+
 from vivarium.config_tree import ConfigTree
 
 TEST_YAML_ONE = """
@@ -29,3 +31,17 @@ def test_load_yaml_file(tmpdir):
     assert d.test_section.test_key == "test_value"
     assert d.test_section.test_key2 == "test_value2"
     assert d.test_section2.test_key == "test_value3"
+
+
+def test_load_modified_yaml_file(tmpdir):
+    tmp_file = tmpdir.join("test_file.yaml")
+    tmp_file.write(TEST_YAML_ONE)
+    d = ConfigTree(str(tmp_file))
+    assert d.test_section.test_key == "test_value"
+
+    # Same-size edit, so only the later modification time marks the change.
+    mtime_ns = os.stat(str(tmp_file)).st_mtime_ns
+    tmp_file.write(TEST_YAML_ONE.replace("test_value", "test_valuX"))
+    os.utime(str(tmp_file), ns=(mtime_ns + 10**9, mtime_ns + 10**9))
+    d = ConfigTree(str(tmp_file))
+    assert d.test_section.test_key == "test_valuX"
@@ -263,6 +263,25 @@ def test_add_components():
     assert cm.list_components() == {c.name: c for c in components}
 
 
+def test_get_components_by_type():
+    config = build_simulation_configuration()
+    cm = ComponentManager()
+    cm.configuration = config
+
+    component_a = MockComponentA(name="component_a")
+    cm.add_components([component_a])
+    assert cm.get_components_by_type(MockComponentA) == [component_a]
+    assert cm.get_components_by_type(MockComponentB) == []
+
+    component_b = MockComponentB(name="component_b")
+    cm.add_components([component_b])
+    assert cm.get_components_by_type(MockComponentB) == [component_b]
+    assert cm.get_components_by_type((MockComponentA, MockComponentB)) == [
+        component_a,
+        component_b,
+    ]
+
+
 @pytest.mark.parametrize(
     "components",
     ([MockComponentA("Eric"), MockComponentB("half", "a", "bee")], [MockComponentA("Eric")]),
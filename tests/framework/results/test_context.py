@@ -5,6 +5,7 @@ import pandas as pd
 import pytest
 
 from vivarium.framework.results.context import ResultsContext
+from vivarium.framework.results.exceptions import ResultsConfigurationError
 
 from .mocks import (
     BASE_POPULATION,
@@ -74,6 +75,20 @@ def test_add_stratification_raises(
         raise ctx.add_stratification(name, sources, categories, mapper, is_vectorized)
 
 
+def test_set_default_stratifications():
+    ctx = ResultsContext()
+    ctx.set_default_stratifications(["age", "sex"])
+    assert ctx._default_stratifications == ("age", "sex")
+    assert ctx._get_stratifications(["handedness"], ["age"]) == ("handedness", "sex")
+    # Equal requests resolve to the same groupers.
+    assert ctx._get_stratifications(["handedness"], ["age"]) is ctx._get_stratifications(
+        ("handedness",), ("age",)
+    )
+
+    with pytest.raises(ResultsConfigurationError, match="Multiple calls"):
+        ctx.set_default_stratifications(["age"])
+
+
 def _aggregate_state_person_time(x: pd.DataFrame) -> float:
     """Helper aggregator function for observation testing"""
     return len(x) * (28 / 365.35)
@@ -374,6 +389,52 @@ def test_gather_results_partial_stratifications_in_results(
         assert all(v == 0 for v in unladen_results.values())
 
 
+def test_gather_results_independent_filters():
+    """Test that each observation's filter is applied to the full population
+    rather than to the population left over from a previous observation."""
+    ctx = ResultsContext()
+    population = BASE_POPULATION.copy()
+    event_name = "collect_metrics"
+
+    ctx.add_stratification("house", ["house"], CATEGORIES, None, True)
+    ctx.add_observation(
+        "tracked_count", "tracked==True", None, len, ["house"], [], event_name
+    )
+    ctx.add_observation(
+        "untracked_count", "tracked==False", None, len, ["house"], [], event_name
+    )
+
+    results = {}
+    for r in ctx.gather_results(population, event_name):
+        results.update(r)
+    assert results["MEASURE_tracked_count_HOUSE_gryffindor"] == 20
+    assert results["MEASURE_untracked_count_HOUSE_gryffindor"] == 20
+
+
+def test_gather_results_key_order_with_unobserved_category():
+    """Test that result keys follow the stratification categories even when
+    the first category is not observed."""
+    ctx = ResultsContext()
+    population = BASE_POPULATION.copy()
+    population = population[population["house"] != CATEGORIES[0]]
+    event_name = "collect_metrics"
+
+    ctx.add_stratification("house", ["house"], CATEGORIES, None, True)
+    ctx.add_stratification("familiar", ["familiar"], FAMILIARS, None, True)
+    ctx.add_observation("house_count", "", None, len, ["house"], [], event_name)
+    ctx.add_observation("pair_count", "", None, len, ["house", "familiar"], [], event_name)
+
+    house_results, pair_results = ctx.gather_results(population, event_name)
+    assert list(house_results) == [
+        f"MEASURE_house_count_HOUSE_{house}" for house in CATEGORIES
+    ]
+    assert list(pair_results) == [
+        f"MEASURE_pair_count_FAMILIAR_{familiar}_HOUSE_{house}"
+        for familiar in FAMILIARS
+        for house in CATEGORIES
+    ]
+
+
 def test__format_results():
     """Test that format results produces the expected number of keys and a specific expected key"""
     ctx = ResultsContext()
@@ -390,6 +451,17 @@ def test__format_results():
     assert expected_key in rv.keys()
 
 
+def test__format_results_additional_keys():
+    ctx = ResultsContext()
+    aggregates = BASE_POPULATION.groupby(["house"]).apply(len)
+    key_suffix = ctx._format_key_suffix(sex="female", age_group="young")
+    assert key_suffix == "_AGE_GROUP_young_SEX_female"
+    rv = ctx._format_results("wizard_count", aggregates, key_suffix)
+
+    assert len(rv.keys()) == len(CATEGORIES)
+    assert "MEASURE_wizard_count_HOUSE_slytherin_AGE_GROUP_young_SEX_female" in rv.keys()
+
+
 def test__bad_aggregator_return():
     """Test that an exception is raised, as expected, when an aggregator
     produces something other than a pd.DataFrame with a single column or a pd.Series"""
@@ -193,3 +193,16 @@ def test_register_binned_stratification_raises(bins, labels):
         raise mgr.register_binned_stratification(
             BIN_SOURCE, "column", BIN_BINNED_COLUMN, bins, labels
         )
+
+
+##############################
+# Tests for `gather_results` #
+##############################
+
+
+def test_gather_results_without_observations(mocker):
+    mgr = ResultsManager()
+    mock_prepare_population = mocker.patch.object(mgr, "_prepare_population")
+    mgr.gather_results("time_step__prepare", mocker.Mock())
+    mock_prepare_population.assert_not_called()
+    assert not mgr.metrics
@@ -114,6 +114,24 @@ def test_listener_priority(event_init):
     assert np.all(signal)
 
 
+def test_listener_added_after_emission(event_init):
+    calls = []
+
+    manager = EventManager()
+    manager.clock = lambda: pd.Timestamp(1990, 1, 1)
+    manager.step_size = lambda: pd.Timedelta(30, "D")
+    manager.add_constraint = lambda f, **kwargs: f
+    emitter = manager.get_emitter("test_event")
+    manager.register_listener("test_event", lambda _: calls.append("second"), priority=9)
+    emitter(event_init["orig"]["index"])
+    assert calls == ["second"]
+
+    manager.register_listener("test_event", lambda _: calls.append("first"), priority=0)
+    calls.clear()
+    emitter(event_init["orig"]["index"])
+    assert calls == ["first", "second"]
+
+
 def test_contains():
     event = "test_event"
 
@@ -33,6 +33,28 @@ def test_rate_to_probability():
     assert np.isclose(prob, 0.00099950016662497809)
 
 
+def test_rate_to_probability_small_rate():
+    rate = np.array([1e-12])
+    prob = rate_to_probability(rate)
+    assert np.isclose(prob, 1e-12, rtol=1e-9, atol=0)
+
+
+def test_rate_to_probability_large_rate():
+    rate = np.array([0.5, 1e6])
+    prob = rate_to_probability(rate)
+    assert np.all(prob <= 1)
+    assert np.isclose(prob[1], 1)
+    # The caller's rates are left untouched.
+    assert rate[1] == 1e6
+
+
+def test_rate_to_probability_float32():
+    rate = np.array([0.001, 1e6], dtype=np.float32)
+    prob = rate_to_probability(rate)
+    assert prob.dtype == np.float32
+    assert np.isclose(prob[0], 0.00099950016662497809)
+
+
 def test_probability_to_rate():
     prob = np.array([0.00099950016662497809])
     rate = probability_to_rate(prob)
@@ -2,7 +2,7 @@ from pathlib import Path
 
 import pytest
 
-from vivarium.interface.utilities import get_output_model_name_string
+from vivarium.interface.utilities import get_output_model_name_string, log_progress
 
 _MODEL_SPEC_STEM = "model_spec_name"
 _ARTIFACT_STEM = "artifact_name"
@@ -71,3 +71,7 @@ def test_get_output_model_name_string(
     output = get_output_model_name_string(artifact_path, model_spec_path)
 
     assert output == expected_output
+
+
+def test_log_progress_yields_sequence():
+    assert list(log_progress(range(5), name="Step")) == list(range(5))